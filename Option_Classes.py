@@ -1,9 +1,10 @@
 # This module defines option classes for pricing various types of options.
-# It includes a base Option class and implementations for European, American, Barrier, and Basket options.
+# It includes a base Option class and implementations for European, American, Barrier, and Basket options
+# (including American-exercise baskets priced by Longstaff-Schwartz Monte Carlo).
 # Each class provides a price() method for computing the option's fair value using appropriate models.
 
 import numpy as np
-from scipy.stats import norm
+from pricing_kernels import american_binomial, longstaff_schwartz_basket, up_and_in_call_payoffs, norm_cdf
 
 class Option:
     def __init__(self, ticker, spot, strike, expiry, rate, vol, option_type="call", dividend_yield=0.0):
@@ -30,41 +31,31 @@ class EuropeanOption(Option):
         d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
         d2 = d1 - sigma * np.sqrt(T)
         if self.option_type == "call":
-            return S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+            return S * np.exp(-q * T) * norm_cdf(d1) - K * np.exp(-r * T) * norm_cdf(d2)
         else:
-            return K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
+            return K * np.exp(-r * T) * norm_cdf(-d2) - S * np.exp(-q * T) * norm_cdf(-d1)
 
-class AmericanPutOption(Option):
-    def __init__(self, *args, steps=100, **kwargs):
-        # American put option using a binomial tree for early exercise
+class AmericanOption(Option):
+    def __init__(self, *args, steps=100, tree="lr", richardson=True, **kwargs):
+        # American call or put priced on a binomial tree with early exercise.
+        # tree="lr" (Leisen-Reimer with Richardson extrapolation) converges smoothly, so far fewer
+        # steps are needed than with tree="crr" (Cox-Ross-Rubinstein) for the same accuracy.
         super().__init__(*args, **kwargs)
         self.steps = steps
+        self.tree = tree
+        self.richardson = richardson
 
     def price(self):
+        # Backward induction runs in the compiled or NumPy kernel (see pricing_kernels)
         S, K, T, r, sigma, N, q = self.spot, self.strike, self.expiry, self.rate, self.vol, self.steps, self.dividend_yield
-        dt = T / N
-        u = np.exp(sigma * np.sqrt(dt))
-        d = 1 / u
-        p = (np.exp((r - q) * dt) - d) / (u - d)
-        discount = np.exp(-r * dt)
-
-        stock_tree = np.zeros((N + 1, N + 1))
-        option_tree = np.zeros((N + 1, N + 1))
-
-        # Build stock and option value trees
-        for i in range(N + 1):
-            for j in range(i + 1):
-                stock_tree[i, j] = S * (u ** j) * (d ** (i - j))
-                option_tree[i, j] = max(K - stock_tree[i, j], 0)
-
-        # Backward induction for early exercise
-        for i in range(N - 1, -1, -1):
-            for j in range(i + 1):
-                hold = discount * (p * option_tree[i + 1, j + 1] + (1 - p) * option_tree[i + 1, j])
-                exercise = K - stock_tree[i, j]
-                option_tree[i, j] = max(hold, exercise)
-
-        return option_tree[0, 0]
+        return american_binomial(S, K, T, r, sigma, N, q, option_type=self.option_type,
+                                 tree=self.tree, richardson=self.richardson)
+
+class AmericanPutOption(AmericanOption):
+    def __init__(self, *args, **kwargs):
+        # American put option; always priced as a put regardless of option_type
+        super().__init__(*args, **kwargs)
+        self.option_type = "put"
 
 class UpAndInCallOption(Option):
     def __init__(self, barrier, simulations=10000, steps=252, *args, **kwargs):
@@ -75,29 +66,11 @@ class UpAndInCallOption(Option):
         self.steps = steps
 
     def price(self):
-        dt = self.expiry / self.steps
+        # Paths are simulated and monitored for the barrier in the compiled or NumPy kernel
         disc = np.exp(-self.rate * self.expiry)
-        q = self.dividend_yield
-        payoffs = []
-
-        for _ in range(self.simulations):
-            prices = [self.spot]
-            barrier_hit = False
-
-            for _ in range(self.steps):
-                Z = np.random.normal()
-                S_next = prices[-1] * np.exp((self.rate - q - 0.5 * self.vol ** 2) * dt + self.vol * np.sqrt(dt) * Z)
-                prices.append(S_next)
-                if S_next >= self.barrier:
-                    barrier_hit = True
-
-            if barrier_hit:
-                payoff = max(prices[-1] - self.strike, 0)
-                payoffs.append(disc * payoff)
-            else:
-                payoffs.append(0)
-
-        return np.mean(payoffs)
+        payoffs = up_and_in_call_payoffs(self.spot, self.strike, self.expiry, self.rate, self.vol,
+                                         self.steps, self.simulations, self.barrier, self.dividend_yield)
+        return disc * np.mean(payoffs)
 
 class BasketCallOption(Option):
     def __init__(self, tickers, spot_prices, weights, strike, expiry, rate, vol, corr_matrix, dividend_yield=0.0, **kwargs):
@@ -125,6 +98,24 @@ class BasketCallOption(Option):
         d1 = (np.log(S_eff / K) + (r - q + 0.5 * sigma_eff ** 2) * T) / (sigma_eff * np.sqrt(T))
         d2 = d1 - sigma_eff * np.sqrt(T)
 
-        price = S_eff * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        price = S_eff * np.exp(-q * T) * norm_cdf(d1) - K * np.exp(-r * T) * norm_cdf(d2)
         return price
 
+
+class AmericanBasketOption(Option):
+    def __init__(self, tickers, spot_prices, weights, strike, expiry, rate, vol, corr_matrix, dividend_yield=0.0,
+                 option_type="call", simulations=10000, steps=50, **kwargs):
+        # American-exercise basket option priced via Longstaff-Schwartz Monte Carlo.
+        # steps is the number of exercise dates; dividend_yield may be a scalar or one yield per asset.
+        super().__init__(ticker="BASKET", spot=spot_prices, strike=strike, expiry=expiry,
+                         rate=rate, vol=vol, option_type=option_type, dividend_yield=dividend_yield)
+        self.tickers = tickers
+        self.weights = np.array(weights)
+        self.corr = np.array(corr_matrix)
+        self.simulations = simulations
+        self.steps = steps
+
+    def price(self):
+        return longstaff_schwartz_basket(self.spot, self.weights, self.strike, self.expiry, self.rate, self.vol,
+                                         self.corr, self.steps, self.simulations, self.dividend_yield,
+                                         option_type=self.option_type)
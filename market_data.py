@@ -1,21 +1,16 @@
 # This module provides functions to fetch and process market data using yfinance.
 # It includes utilities to get historical close prices, estimate volatility, compute correlation matrices,
 # and aggregate all relevant market data for a set of tickers.
+# yfinance and pandas are imported inside the functions that download data so importing this
+# module does not load them.
 
-import yfinance as yf
 import numpy as np
-import pandas as pd
-import datetime
-
-
-import yfinance as yf
-import pandas as pd
-
-import yfinance as yf
 from datetime import datetime, timedelta
 
 # Fetches the closing price for a given ticker and date (YYYY-MM-DD)
 def get_close_price(ticker, date_str):
+    import yfinance as yf
+
     date = datetime.strptime(date_str, "%Y-%m-%d")
     next_day = date + timedelta(days=1)
 
@@ -28,6 +23,9 @@ def get_close_price(ticker, date_str):
 
 # Estimates annualized volatility for a ticker up to a given end date, using a rolling window (default 252 trading days)
 def get_volatility(ticker, end_date, window=252):
+    import pandas as pd
+    import yfinance as yf
+
     end = pd.to_datetime(end_date) + pd.Timedelta(days=1)
     data = yf.download(ticker, end=end)
     returns = data['Close'].pct_change().dropna()
@@ -36,6 +34,9 @@ def get_volatility(ticker, end_date, window=252):
 
 # Computes the correlation matrix of log returns for a list of tickers over a specified window
 def get_correlation_matrix(tickers, window=60, end_date=None):
+    import pandas as pd
+    import yfinance as yf
+
     try:
         if end_date is not None:
             end = pd.to_datetime(end_date)
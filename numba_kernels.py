@@ -0,0 +1,53 @@
+# This module holds the Numba-compiled versions of the kernels in pricing_kernels.
+# It is only imported the first time the Numba backend is used, so processes that never
+# price a tree or barrier option do not pay for importing Numba/LLVM.
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def american_tree(S, K, u, d, p, discount, N, phi):
+    # Backward induction over a single row of option values, O(N) memory.
+    # phi = 1 for a call, -1 for a put.
+    values = np.empty(N + 1)
+    for j in range(N + 1):
+        values[j] = max(phi * (S * u ** j * d ** (N - j) - K), 0.0)
+    for i in range(N - 1, -1, -1):
+        for j in range(i + 1):
+            hold = discount * (p * values[j + 1] + (1 - p) * values[j])
+            exercise = phi * (S * u ** j * d ** (i - j) - K)
+            values[j] = max(hold, exercise)
+    return values[0]
+
+
+@njit(cache=True, parallel=True)
+def gbm_paths(S0, Z, drift, diffusion, barrier):
+    # Builds every path in parallel and flags the ones that touch the barrier
+    M, steps = Z.shape
+    paths = np.empty((M, steps + 1))
+    hit = np.zeros(M, dtype=np.bool_)
+    for m in prange(M):
+        paths[m, 0] = S0
+        for t in range(steps):
+            paths[m, t + 1] = paths[m, t] * np.exp(drift + diffusion * Z[m, t])
+            if paths[m, t + 1] >= barrier:
+                hit[m] = True
+    return paths, hit
+
+
+@njit(cache=True, parallel=True)
+def up_and_in_payoffs(S0, K, Z, drift, diffusion, barrier):
+    # Same monitoring as gbm_paths but only keeps the running price per path
+    M, steps = Z.shape
+    payoffs = np.zeros(M)
+    for m in prange(M):
+        S = S0
+        hit = False
+        for t in range(steps):
+            S = S * np.exp(drift + diffusion * Z[m, t])
+            if S >= barrier:
+                hit = True
+        if hit:
+            payoffs[m] = max(S - K, 0.0)
+    return payoffs
@@ -0,0 +1,207 @@
+# This module provides the numerical kernels behind the option pricers.
+# The tree and path-dependent kernels have a compiled Numba implementation (numba_kernels,
+# parallel over paths and cached to disk so the JIT cost is only paid once per machine) and a
+# vectorised NumPy implementation that is used automatically when Numba is not installed.
+# The backend can be switched with set_backend(). Numba is only imported on first use so that
+# importing the pricing core stays cheap for pool workers.
+
+import importlib.util
+import math
+import warnings
+import numpy as np
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+BACKENDS = ("auto", "numba", "numpy")
+_backend = "auto"
+_numba_kernels = None
+
+
+def set_backend(name):
+    # Selects the kernel backend: "numba", "numpy" or "auto" (Numba when installed, else NumPy)
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', expected one of {BACKENDS}")
+    if name == "numba" and not NUMBA_AVAILABLE:
+        warnings.warn("Numba is not installed, falling back to the NumPy backend.")
+    _backend = name
+
+
+def get_backend():
+    # Returns the backend that will actually be used ("numba" or "numpy")
+    if _backend != "numpy" and NUMBA_AVAILABLE:
+        return "numba"
+    return "numpy"
+
+
+def _load_numba_kernels():
+    # Imports the compiled kernels on first use; a broken Numba install degrades to NumPy
+    global _numba_kernels, NUMBA_AVAILABLE
+    if _numba_kernels is None and NUMBA_AVAILABLE:
+        try:
+            import numba_kernels
+            _numba_kernels = numba_kernels
+        except ImportError as e:
+            warnings.warn(f"Numba could not be imported ({e}), falling back to the NumPy backend.")
+            NUMBA_AVAILABLE = False
+    return _numba_kernels
+
+
+def norm_cdf(x):
+    # Standard normal CDF via math.erfc, so the pricers do not need SciPy
+    if np.ndim(x) == 0:
+        return 0.5 * math.erfc(-float(x) / math.sqrt(2.0))
+    return 0.5 * np.vectorize(math.erfc, otypes=[float])(-np.asarray(x, dtype=float) / math.sqrt(2.0))
+
+
+# ---------------------------------------------------------------------------
+# NumPy kernels
+# ---------------------------------------------------------------------------
+
+def _american_tree_numpy(S, K, u, d, p, discount, N, phi):
+    j = np.arange(N + 1)
+    values = np.maximum(phi * (S * u ** j * d ** (N - j) - K), 0.0)
+    for i in range(N - 1, -1, -1):
+        j = np.arange(i + 1)
+        hold = discount * (p * values[1:i + 2] + (1 - p) * values[:i + 1])
+        exercise = phi * (S * u ** j * d ** (i - j) - K)
+        values = np.maximum(hold, exercise)
+    return values[0]
+
+
+def _gbm_paths_numpy(S0, Z, drift, diffusion, barrier):
+    log_paths = np.cumsum(drift + diffusion * Z, axis=1)
+    paths = np.empty((Z.shape[0], Z.shape[1] + 1))
+    paths[:, 0] = S0
+    paths[:, 1:] = S0 * np.exp(log_paths)
+    hit = np.any(paths[:, 1:] >= barrier, axis=1)
+    return paths, hit
+
+
+def _up_and_in_payoffs_numpy(S0, K, Z, drift, diffusion, barrier):
+    paths, hit = _gbm_paths_numpy(S0, Z, drift, diffusion, barrier)
+    return np.where(hit, np.maximum(paths[:, -1] - K, 0.0), 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Public entry points
+# ---------------------------------------------------------------------------
+
+def _crr_parameters(S, K, T, r, sigma, N, q):
+    # Cox-Ross-Rubinstein up/down factors and risk-neutral probability
+    dt = T / N
+    u = math.exp(sigma * math.sqrt(dt))
+    d = 1 / u
+    p = (math.exp((r - q) * dt) - d) / (u - d)
+    return u, d, p
+
+
+def _peizer_pratt(z, N):
+    # Peizer-Pratt method 2 inversion used by Leisen-Reimer to map a normal quantile to a probability
+    return 0.5 + math.copysign(0.5, z) * math.sqrt(
+        1 - math.exp(-(z / (N + 1 / 3 + 0.1 / (N + 1))) ** 2 * (N + 1 / 6)))
+
+
+def _leisen_reimer_parameters(S, K, T, r, sigma, N, q):
+    # Leisen-Reimer tree centred on the strike, so prices converge smoothly instead of oscillating
+    dt = T / N
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+    p = _peizer_pratt(d2, N)
+    growth = math.exp((r - q) * dt)
+    u = growth * _peizer_pratt(d1, N) / p
+    d = (growth - p * u) / (1 - p)
+    return u, d, p
+
+
+TREES = {"crr": _crr_parameters, "lr": _leisen_reimer_parameters}
+
+
+def _american_tree_price(S, K, T, r, sigma, N, q, phi, tree):
+    u, d, p = TREES[tree](S, K, T, r, sigma, N, q)
+    args = (S, K, u, d, p, math.exp(-r * T / N), N, phi)
+    if get_backend() == "numba" and _load_numba_kernels() is not None:
+        return _numba_kernels.american_tree(*args)
+    return _american_tree_numpy(*args)
+
+
+def american_binomial(S, K, T, r, sigma, N, q=0.0, option_type="put", tree="lr", richardson=True):
+    # Binomial price of an American call or put with continuous dividend yield q.
+    # tree="lr" uses a Leisen-Reimer tree (N is rounded up to odd) and, with richardson=True,
+    # extrapolates the N and 2N+1 step prices assuming first-order convergence in N.
+    # tree="crr" is the plain Cox-Ross-Rubinstein tree.
+    if tree not in TREES:
+        raise ValueError(f"Unknown tree '{tree}', expected one of {tuple(TREES)}")
+    S, K, T, r, sigma, q, N = float(S), float(K), float(T), float(r), float(sigma), float(q), int(N)
+    phi = 1.0 if option_type == "call" else -1.0
+    if tree == "crr":
+        return _american_tree_price(S, K, T, r, sigma, N, q, phi, tree)
+
+    if N % 2 == 0:
+        N += 1
+    price = _american_tree_price(S, K, T, r, sigma, N, q, phi, tree)
+    if not richardson:
+        return price
+    N_fine = 2 * N + 1
+    price_fine = _american_tree_price(S, K, T, r, sigma, N_fine, q, phi, tree)
+    return (N_fine * price_fine - N * price) / (N_fine - N)
+
+
+def simulate_gbm_paths(S0, T, r, sigma, steps, simulations, barrier, q=0.0):
+    # Simulates GBM paths (shape: simulations x steps+1) and flags paths with S >= barrier after t=0.
+    # Normals are always drawn from NumPy's global generator so np.random.seed() is honoured by both backends.
+    dt = T / steps
+    Z = np.random.normal(size=(simulations, steps))
+    drift = (r - q - 0.5 * sigma ** 2) * dt
+    diffusion = sigma * np.sqrt(dt)
+    args = (float(S0), Z, float(drift), float(diffusion), float(barrier))
+    if get_backend() == "numba" and _load_numba_kernels() is not None:
+        return _numba_kernels.gbm_paths(*args)
+    return _gbm_paths_numpy(*args)
+
+
+def up_and_in_call_payoffs(S0, K, T, r, sigma, steps, simulations, barrier, q=0.0):
+    # Undiscounted up-and-in call payoff for each simulated path
+    dt = T / steps
+    Z = np.random.normal(size=(simulations, steps))
+    drift = (r - q - 0.5 * sigma ** 2) * dt
+    diffusion = sigma * np.sqrt(dt)
+    args = (float(S0), float(K), Z, float(drift), float(diffusion), float(barrier))
+    if get_backend() == "numba" and _load_numba_kernels() is not None:
+        return _numba_kernels.up_and_in_payoffs(*args)
+    return _up_and_in_payoffs_numpy(*args)
+
+
+def longstaff_schwartz_basket(spots, weights, K, T, r, vols, corr, steps, simulations, q=0.0,
+                              option_type="call", degree=3):
+    # Longstaff-Schwartz price of an American option on a weighted basket of correlated GBM assets.
+    # Paths for all assets are simulated at once; the continuation value at each exercise date is a
+    # polynomial regression (in basket value / K) over the in-the-money paths.
+    spots = np.asarray(spots, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    vols = np.asarray(vols, dtype=float)
+    q = np.broadcast_to(np.asarray(q, dtype=float), spots.shape)
+    phi = 1.0 if option_type == "call" else -1.0
+    dt = T / steps
+    discount = math.exp(-r * dt)
+
+    chol = np.linalg.cholesky(np.asarray(corr, dtype=float))
+    Z = np.random.normal(size=(simulations, steps, len(spots))) @ chol.T
+    log_paths = np.cumsum((r - q - 0.5 * vols ** 2) * dt + vols * math.sqrt(dt) * Z, axis=1)
+    basket = (spots * np.exp(log_paths)) @ weights
+    payoff = np.maximum(phi * (basket - K), 0.0)
+
+    # Backward induction: cashflow holds each path's value at the current date under the exercise policy
+    cashflow = payoff[:, -1]
+    for t in range(steps - 2, -1, -1):
+        cashflow = cashflow * discount
+        itm = np.flatnonzero(payoff[:, t] > 0)
+        if len(itm) <= degree + 1:
+            continue
+        X = np.vander(basket[itm, t] / K, degree + 1)
+        coef = np.linalg.lstsq(X, cashflow[itm], rcond=None)[0]
+        exercise = itm[payoff[itm, t] > X @ coef]
+        cashflow[exercise] = payoff[exercise, t]
+
+    immediate = max(phi * (weights @ spots - K), 0.0)
+    return max(discount * np.mean(cashflow), immediate)
@@ -2,11 +2,11 @@
 # It includes functions to plot how option prices change with respect to spot price and volatility
 # for various option types (analytical, barrier, basket), as well as a function to visualize
 # Monte Carlo paths for up-and-in barrier options.
+# matplotlib is imported inside the plotting functions so importing this module stays cheap.
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
 from Option_Classes import UpAndInCallOption, BasketCallOption
+from pricing_kernels import simulate_gbm_paths
 
 # Plots price sensitivity to spot and volatility for analytical options (e.g., European)
 def plot_spot_vol_sensitivity(option_class, label, base_spot, base_vol, 
@@ -83,6 +83,8 @@ def plot_spot_vol_sensitivity_basket(label, base_spots, base_vols, weights, corr
 
 # Internal utility plotter for sensitivity curves
 def _plot_sensitivity_curves(spot_vals, prices_spot, vol_vals, prices_vol, label):
+    import matplotlib.pyplot as plt
+
     fig, axs = plt.subplots(1, 2, figsize=(14, 5))
 
     axs[0].plot(spot_vals, prices_spot, color="blue")
@@ -155,6 +157,8 @@ def plot_spot_vol_sensitivity_basket_bs(label, base_spots, base_vols, weights, c
         prices_vol.append(opt.price())
 
     # Plotting
+    import matplotlib.pyplot as plt
+
     fig, axs = plt.subplots(1, 2, figsize=(14, 5))
 
     axs[0].plot(spot_vals, prices_spot, color="blue")
@@ -180,32 +184,19 @@ def visualize_up_and_in_barrier_call(S0, K, T, r, sigma, B, M=100, steps=252, ra
     Shows which paths contribute to payoff, which are knocked in but out-of-the-money, and which never cross the barrier.
     """
     np.random.seed(random_seed)
-    dt = T / steps
     time_grid = np.linspace(0, T, steps + 1)
 
-    contributing_paths = []
-    inactivated_paths = []
-    knocked_in_no_payoff = []
-
-    for _ in range(M):
-        prices = [S0]
-        barrier_hit = False
-        for _ in range(steps):
-            Z = np.random.normal()
-            S_next = prices[-1] * np.exp((r - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * Z)
-            prices.append(S_next)
-            if S_next >= B:
-                barrier_hit = True
-
-        if barrier_hit:
-            if prices[-1] > K:
-                contributing_paths.append(prices)
-            else:
-                knocked_in_no_payoff.append(prices)
-        else:
-            inactivated_paths.append(prices)
+    paths, barrier_hit = simulate_gbm_paths(S0, T, r, sigma, steps, M, B)
+    in_the_money = paths[:, -1] > K
+
+    contributing_paths = paths[barrier_hit & in_the_money]
+    inactivated_paths = paths[~barrier_hit]
+    knocked_in_no_payoff = paths[barrier_hit & ~in_the_money]
 
     # Plotting
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+
     plt.figure(figsize=(10, 6))
 
     red_line = None